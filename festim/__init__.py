@@ -27,6 +27,8 @@ from .helpers import (
     as_constant,
     as_expression,
     as_constant_or_expression,
+    compile_form,
+    form_compiler_parameters,
 )
 
 from .meshing.mesh import Mesh
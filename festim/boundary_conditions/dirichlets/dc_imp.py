@@ -1,15 +1,16 @@
 from festim import DirichletBC, BoundaryConditionExpression, k_B
 import fenics as f
+import numpy as np
 import sympy as sp
 
 
 def dc_imp(T, phi, R_p, D_0, E_D, Kr_0=None, E_Kr=None, Kd_0=None, E_Kd=None, P=None):
-    D = D_0 * f.exp(-E_D / k_B / T)
+    D = D_0 * np.exp(-E_D / k_B / T)
     value = phi * R_p / D
     if Kr_0 is not None:
-        Kr = Kr_0 * f.exp(-E_Kr / k_B / T)
+        Kr = Kr_0 * np.exp(-E_Kr / k_B / T)
         if Kd_0 is not None:
-            Kd = Kd_0 * f.exp(-E_Kd / k_B / T)
+            Kd = Kd_0 * np.exp(-E_Kd / k_B / T)
             value += ((phi + Kd * P) / Kr) ** 0.5
         else:
             value += (phi / Kr) ** 0.5
@@ -1,5 +1,6 @@
 from festim import BoundaryCondition, k_B
 import fenics as f
+import numpy as np
 import sympy as sp
 
 
@@ -119,7 +120,7 @@ class BoundaryConditionTheta(f.UserExpression):
         S_0 = material.S_0
         E_S = material.E_S
         c = self._bci(x)
-        S = S_0 * f.exp(-E_S / k_B / self._T(x))
+        S = S_0 * np.exp(-E_S / k_B / self._T(x))
         if material.solubility_law == "sievert":
             value[0] = c / S
         elif material.solubility_law == "henry":
@@ -1,4 +1,5 @@
 from festim import Mobile, k_B
+import festim
 import fenics as f
 
 
@@ -37,7 +38,12 @@ class Theta(Mobile):
                 F += comp / S * v * dx(mat.id)
             elif mat.solubility_law == "henry":
                 F += (comp / S) ** 0.5 * v * dx(mat.id)
-        f.solve(F == 0, prev_sol, bcs=[])
+        f.solve(
+            F == 0,
+            prev_sol,
+            bcs=[],
+            form_compiler_parameters=festim.form_compiler_parameters,
+        )
 
         f.assign(self.previous_solution, prev_sol)
 
@@ -93,6 +99,7 @@ class Theta(Mobile):
             L=f.rhs(self.form_post_processing),
             u=self.post_processing_solution,
             bcs=[],
+            form_compiler_parameters=festim.form_compiler_parameters,
         )
         solver = f.LinearVariationalSolver(problem)
         solver.solve()
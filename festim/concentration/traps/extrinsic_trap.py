@@ -55,6 +55,7 @@ class ExtrinsicTrapBase(Trap):
             setattr(self, name, as_constant_or_expression(val))
         self.density_previous_solution = None
         self.density_test_function = None
+        self.density_problem = None
 
     @property
     def newton_solver(self):
@@ -90,7 +90,11 @@ class Traps(list):
             if isinstance(trap, festim.ExtrinsicTrapBase):
                 trap.density = [f.Function(V)]
                 trap.density_test_function = f.TestFunction(V)
-                trap.density_previous_solution = f.project(f.Constant(0), V)
+                trap.density_previous_solution = f.project(
+                    f.Constant(0),
+                    V,
+                    form_compiler_parameters=festim.form_compiler_parameters,
+                )
 
     def define_variational_problem_extrinsic_traps(self, dx, dt, T):
         """
@@ -117,9 +121,13 @@ class Traps(list):
     def solve_extrinsic_traps(self):
         for trap in self:
             if isinstance(trap, festim.ExtrinsicTrapBase):
-                du_t = f.TrialFunction(trap.density[0].function_space())
-                J_t = f.derivative(trap.form_density, trap.density[0], du_t)
-                problem = festim.Problem(J_t, trap.form_density, [])
+                # the problem is reused unless the form has been redefined
+                problem = trap.density_problem
+                if problem is None or problem.residual_form is not trap.form_density:
+                    du_t = f.TrialFunction(trap.density[0].function_space())
+                    J_t = f.derivative(trap.form_density, trap.density[0], du_t)
+                    problem = festim.Problem(J_t, trap.form_density, [])
+                    trap.density_problem = problem
 
                 f.begin(
                     "Solving nonlinear variational problem."
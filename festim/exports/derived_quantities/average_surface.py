@@ -1,4 +1,4 @@
-from festim import SurfaceQuantity
+from festim import SurfaceQuantity, compile_form
 import fenics as f
 
 
@@ -39,7 +39,14 @@ class AverageSurface(SurfaceQuantity):
         else:
             return quantity_title
 
+    def _reset_forms(self):
+        super()._reset_forms()
+        # the size of the surface is assembled again with the forms
+        self._surface_measure = None
+
     def compute(self):
-        return f.assemble(self.function * self.ds(self.surface)) / f.assemble(
-            1 * self.ds(self.surface)
-        )
+        if self._form is None:
+            self._form = compile_form(self.function * self.ds(self.surface))
+        if self._surface_measure is None:
+            self._surface_measure = f.assemble(compile_form(1 * self.ds(self.surface)))
+        return f.assemble(self._form) / self._surface_measure
@@ -1,4 +1,4 @@
-from festim import VolumeQuantity
+from festim import VolumeQuantity, compile_form
 import fenics as f
 
 
@@ -38,7 +38,14 @@ class AverageVolume(VolumeQuantity):
         else:
             return quantity_title
 
+    def _reset_forms(self):
+        super()._reset_forms()
+        # the size of the volume is assembled again with the forms
+        self._volume_measure = None
+
     def compute(self):
-        return f.assemble(self.function * self.dx(self.volume)) / f.assemble(
-            1 * self.dx(self.volume)
-        )
+        if self._form is None:
+            self._form = compile_form(self.function * self.dx(self.volume))
+        if self._volume_measure is None:
+            self._volume_measure = f.assemble(compile_form(1 * self.dx(self.volume)))
+        return f.assemble(self._form) / self._volume_measure
@@ -1,7 +1,10 @@
 from festim import (
     MinimumVolume,
     MaximumVolume,
+    TotalVolume,
+    TotalSurface,
     DerivedQuantity,
+    compile_form,
 )
 import fenics as f
 import os
@@ -50,6 +53,18 @@ class DerivedQuantities(list):
 
         self.data = []
         self.t = []
+        self._totals_forms = {}
+        self._real_spaces = {}
+
+    @property
+    def data(self):
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        # new data means the file has to be written from scratch
+        self._nb_rows_written = 0
+        self._data = value
 
     @property
     def derived_quantities(self):
@@ -107,6 +122,8 @@ class DerivedQuantities(list):
                 raise TypeError("filename must be a string")
             if not value.endswith(".csv"):
                 raise ValueError("filename must end with .csv")
+        # a new file has to be written from scratch
+        self._nb_rows_written = 0
         self._filename = value
 
     def make_header(self):
@@ -123,10 +140,11 @@ class DerivedQuantities(list):
 
     def assign_measures_to_quantities(self, dx, ds):
         self.volume_markers = dx.subdomain_data()
+        mesh = dx.subdomain_data().mesh()
         for quantity in self:
             quantity.dx = dx
             quantity.ds = ds
-            quantity.n = f.FacetNormal(dx.subdomain_data().mesh())
+            quantity.n = f.FacetNormal(mesh)
 
     def assign_properties_to_quantities(self, materials):
         """Assign properties attributes to all DerivedQuantity objects
@@ -141,19 +159,103 @@ class DerivedQuantities(list):
             quantity.thermal_cond = materials.thermal_cond
             quantity.Q = materials.Q
 
+    def _real_space(self, mesh, dim):
+        """Returns the space of real vectors of size dim on mesh used to
+        assemble grouped totals. The space is only created once per size.
+
+        Args:
+            mesh (fenics.Mesh): the mesh
+            dim (int): the size of the vectors
+
+        Returns:
+            fenics.FunctionSpace, list: the function space and the dof of
+                each component
+        """
+        if dim not in self._real_spaces or self._real_spaces[dim][0] is not mesh:
+            V = f.VectorFunctionSpace(mesh, "R", 0, dim=dim)
+            dofs = [V.sub(i).dofmap().dofs()[0] for i in range(dim)]
+            self._real_spaces[dim] = (mesh, V, dofs)
+        _, V, dofs = self._real_spaces[dim]
+        return V, dofs
+
+    def _compute_totals(self):
+        """Computes the festim.TotalVolume (resp. festim.TotalSurface)
+        objects sharing the same function in a single assembly of a vector
+        form, so that the mesh is only traversed once for all of them
+        instead of once per quantity
+
+        Returns:
+            dict: the computed value of each grouped quantity
+        """
+        values = {}
+        # the components of the vector are only gathered in serial
+        if f.MPI.size(f.MPI.comm_world) > 1:
+            return values
+
+        groups = {}
+        for quantity in self:
+            # subclasses may override compute() and are computed on their own
+            if type(quantity) is TotalVolume:
+                measure = quantity.dx
+            elif type(quantity) is TotalSurface:
+                measure = quantity.ds
+            else:
+                continue
+            # integrals of a form must share the same subdomain data, other
+            # quantities fall back to their own compute()
+            key = (id(quantity.function), type(quantity), id(measure.subdomain_data()))
+            groups.setdefault(key, []).append(quantity)
+
+        for quantities in groups.values():
+            if len(quantities) < 2:
+                continue
+            key = tuple(id(quantity) for quantity in quantities)
+            function = quantities[0].function
+            dependencies = [
+                (
+                    (quantity.function, quantity.dx, quantity.volume)
+                    if type(quantity) is TotalVolume
+                    else (quantity.function, quantity.ds, quantity.surface)
+                )
+                for quantity in quantities
+            ]
+            cached = self._totals_forms.get(key)
+            # (re)create the form if the function or a measure has changed
+            if cached is None or any(
+                old[0] is not new[0] or old[1] is not new[1] or old[2] != new[2]
+                for old, new in zip(cached[0], dependencies)
+            ):
+                # ufl_domain() also works for expressions like the retention
+                mesh = function.ufl_domain().ufl_cargo()
+                V, dofs = self._real_space(mesh, len(quantities))
+                v = f.TestFunction(V)
+                form = 0
+                for i, (_, measure, region) in enumerate(dependencies):
+                    form += function * v[i] * measure(region)
+                self._totals_forms[key] = (dependencies, compile_form(form), dofs)
+
+            _, form, dofs = self._totals_forms[key]
+            vector = f.assemble(form).get_local()
+            for quantity, dof in zip(quantities, dofs):
+                values[quantity] = float(vector[dof])
+        return values
+
     def compute(self, t):
         # TODO need to support for soret flag in surface flux
+        # check if first time writing data
+        if len(self.data) == 0:
+            self.data = [self.make_header()]
+
+        totals = self._compute_totals()
         row = [t]
         for quantity in self:
-            if isinstance(quantity, (MaximumVolume, MinimumVolume)):
+            if quantity in totals:
+                value = totals[quantity]
+            elif isinstance(quantity, (MaximumVolume, MinimumVolume)):
                 value = quantity.compute(self.volume_markers)
             else:
                 value = quantity.compute()
 
-            # check if first time writing data
-            if len(self.data) == 0:
-                self.data = [self.make_header()]
-
             quantity.data.append(value)
             quantity.t.append(t)
             row.append(value)
@@ -168,8 +270,22 @@ class DerivedQuantities(list):
             if not os.path.exists(dirname):
                 os.makedirs(dirname, exist_ok=True)
 
-            # save the data to csv
-            np.savetxt(self.filename, np.array(self.data), fmt="%s", delimiter=",")
+            # save the data to csv, only the rows that haven't been
+            # written yet are appended to the file
+            # the file is rewritten if rows were removed from data
+            if len(self.data) < self._nb_rows_written:
+                self._nb_rows_written = 0
+            if self._nb_rows_written == 0:
+                mode = "w"
+            else:
+                mode = "a"
+            new_rows = self.data[self._nb_rows_written :]
+            if new_rows:
+                with open(self.filename, mode) as file:
+                    np.savetxt(
+                        file, np.array(new_rows, dtype=str), fmt="%s", delimiter=","
+                    )
+            self._nb_rows_written = len(self.data)
         return True
 
     def is_export(self, t, final_time, nb_iterations):
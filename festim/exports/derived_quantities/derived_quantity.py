@@ -1,6 +1,31 @@
 from festim import Export
 
 
+def _form_attribute(name):
+    """Creates a property of a DerivedQuantity that the compiled forms
+    depend on. The forms are cleared when a new object is assigned.
+
+    Args:
+        name (str): the name of the attribute
+
+    Returns:
+        property: the property
+    """
+    private_name = "_" + name
+
+    def getter(self):
+        return getattr(self, private_name)
+
+    def setter(self, value):
+        # compiled forms hold a reference to the objects they were built
+        # with and need to be recreated if one of them is rebound
+        if value is not getattr(self, private_name, None):
+            self._reset_forms()
+        setattr(self, private_name, value)
+
+    return property(getter, setter)
+
+
 class DerivedQuantity(Export):
     """
     Parent class of all derived quantities
@@ -9,7 +34,18 @@ class DerivedQuantity(Export):
         field (str, int):  the field ("solute", 0, 1, "T", "retention")
     """
 
+    function = _form_attribute("function")
+    dx = _form_attribute("dx")
+    ds = _form_attribute("ds")
+    n = _form_attribute("n")
+    D = _form_attribute("D")
+    S = _form_attribute("S")
+    thermal_cond = _form_attribute("thermal_cond")
+    Q = _form_attribute("Q")
+    T = _form_attribute("T")
+
     def __init__(self, field) -> None:
+        self._reset_forms()
         super().__init__(field=field)
         self.dx = None
         self.ds = None
@@ -18,10 +54,15 @@ class DerivedQuantity(Export):
         self.S = None
         self.thermal_cond = None
         self.Q = None
+        self.T = None
         self.data = []
         self.t = []
         self.show_units = False
 
+    def _reset_forms(self):
+        """Clears the compiled forms cached by compute()"""
+        self._form = None
+
 
 class VolumeQuantity(DerivedQuantity):
     """DerivedQuantity relative to a volume
@@ -45,6 +86,7 @@ class VolumeQuantity(DerivedQuantity):
         if not isinstance(value, int) or isinstance(value, bool):
             raise TypeError("volume should be an int")
 
+        self._reset_forms()
         self._volume = value
 
 
@@ -70,4 +112,5 @@ class SurfaceQuantity(DerivedQuantity):
     def surface(self, value):
         if not isinstance(value, int) or isinstance(value, bool):
             raise TypeError("surface should be an int")
+        self._reset_forms()
         self._surface = value
@@ -1,4 +1,4 @@
-from festim import SurfaceQuantity, k_B
+from festim import SurfaceQuantity, k_B, compile_form
 import fenics as f
 import numpy as np
 
@@ -70,19 +70,27 @@ class SurfaceFlux(SurfaceQuantity):
         }
         return field_to_prop[self.field]
 
+    def _reset_forms(self):
+        super()._reset_forms()
+        self._soret_form = None
+
     def compute(self, soret=False):
-        flux = f.assemble(
-            self.prop * f.dot(f.grad(self.function), self.n) * self.ds(self.surface)
-        )
-        if soret and self.field in [0, "0", "solute"]:
-            flux += f.assemble(
-                self.prop
-                * self.function
-                * self.Q
-                / (k_B * self.T**2)
-                * f.dot(f.grad(self.T), self.n)
-                * self.ds(self.surface)
+        if self._form is None:
+            self._form = compile_form(
+                self.prop * f.dot(f.grad(self.function), self.n) * self.ds(self.surface)
             )
+        flux = f.assemble(self._form)
+        if soret and self.field in [0, "0", "solute"]:
+            if self._soret_form is None:
+                self._soret_form = compile_form(
+                    self.prop
+                    * self.function
+                    * self.Q
+                    / (k_B * self.T**2)
+                    * f.dot(f.grad(self.T), self.n)
+                    * self.ds(self.surface)
+                )
+            flux += f.assemble(self._soret_form)
         return flux
 
 
@@ -103,6 +111,10 @@ class SurfaceFluxCylindrical(SurfaceFlux):
         surface (int): the surface id
         azimuth_range (tuple, optional): Range of the azimuthal angle
             (theta) needs to be between 0 and 2 pi. Defaults to (0, 2 * np.pi).
+
+    Attributes:
+        r (ufl.indexed.Indexed): the radial coordinate of the mesh of the
+            function, set when the form is compiled
     """
 
     def __init__(self, field, surface, azimuth_range=(0, 2 * np.pi)) -> None:
@@ -141,23 +153,20 @@ class SurfaceFluxCylindrical(SurfaceFlux):
                 "Soret effect not implemented for cylindrical coordinates"
             )
 
-        if self.r is None:
-            mesh = (
-                self.function.function_space().mesh()
-            )  # get the mesh from the function
-            rthetaz = f.SpatialCoordinate(mesh)  # get the coordinates from the mesh
-            self.r = rthetaz[0]  # only care about r here
-
         # dS_z = r dr dtheta , assuming axisymmetry dS_z = theta r dr
         # dS_r = r dz dtheta , assuming axisymmetry dS_r = theta r dz
         # in both cases the expression with self.ds is the same
-
-        flux = f.assemble(
-            self.prop
-            * self.r
-            * f.dot(f.grad(self.function), self.n)
-            * self.ds(self.surface)
-        )
+        if self._form is None:
+            # get the radial coordinate from the mesh of the function
+            mesh = self.function.function_space().mesh()
+            self.r = f.SpatialCoordinate(mesh)[0]
+            self._form = compile_form(
+                self.prop
+                * self.r
+                * f.dot(f.grad(self.function), self.n)
+                * self.ds(self.surface)
+            )
+        flux = f.assemble(self._form)
         flux *= self.azimuth_range[1] - self.azimuth_range[0]
         return flux
 
@@ -181,6 +190,10 @@ class SurfaceFluxSpherical(SurfaceFlux):
             (phi) needs to be between 0 and pi. Defaults to (0, np.pi).
         polar_range (tuple, optional): Range of the polar angle
             (theta) needs to be between - pi and pi. Defaults to (-np.pi, np.pi).
+
+    Attributes:
+        r (ufl.indexed.Indexed): the radial coordinate of the mesh of the
+            function, set when the form is compiled
     """
 
     def __init__(
@@ -232,22 +245,20 @@ class SurfaceFluxSpherical(SurfaceFlux):
                 "Soret effect not implemented for spherical coordinates"
             )
 
-        if self.r is None:
-            mesh = (
-                self.function.function_space().mesh()
-            )  # get the mesh from the function
-            rthetaphi = f.SpatialCoordinate(mesh)  # get the coordinates from the mesh
-            self.r = rthetaphi[0]  # only care about r here
-
         # dS_r = r^2 sin(theta) dtheta dphi
         # integral(f dS_r) = integral(f r^2 sin(theta) dtheta dphi)
         #                  = (phi2 - phi1) * (-cos(theta2) + cos(theta1)) * f r^2
-        flux = f.assemble(
-            self.prop
-            * self.r**2
-            * f.dot(f.grad(self.function), self.n)
-            * self.ds(self.surface)
-        )
+        if self._form is None:
+            # get the radial coordinate from the mesh of the function
+            mesh = self.function.function_space().mesh()
+            self.r = f.SpatialCoordinate(mesh)[0]
+            self._form = compile_form(
+                self.prop
+                * self.r**2
+                * f.dot(f.grad(self.function), self.n)
+                * self.ds(self.surface)
+            )
+        flux = f.assemble(self._form)
         flux *= (self.polar_range[1] - self.polar_range[0]) * (
             -np.cos(self.azimuth_range[1]) + np.cos(self.azimuth_range[0])
         )
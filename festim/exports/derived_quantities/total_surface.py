@@ -1,4 +1,4 @@
-from festim import SurfaceQuantity
+from festim import SurfaceQuantity, compile_form
 import fenics as f
 
 
@@ -53,4 +53,6 @@ class TotalSurface(SurfaceQuantity):
             return quantity_title
 
     def compute(self):
-        return f.assemble(self.function * self.ds(self.surface))
+        if self._form is None:
+            self._form = compile_form(self.function * self.ds(self.surface))
+        return f.assemble(self._form)
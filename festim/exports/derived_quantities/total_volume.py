@@ -1,4 +1,4 @@
-from festim import VolumeQuantity
+from festim import VolumeQuantity, compile_form
 import fenics as f
 
 
@@ -53,4 +53,6 @@ class TotalVolume(VolumeQuantity):
             return quantity_title
 
     def compute(self):
-        return f.assemble(self.function * self.dx(self.volume))
+        if self._form is None:
+            self._form = compile_form(self.function * self.dx(self.volume))
+        return f.assemble(self._form)
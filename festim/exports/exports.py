@@ -91,7 +91,9 @@ class Exports(list):
                                 label_to_function[quantity.field], f.Function
                             ):
                                 label_to_function[quantity.field] = f.project(
-                                    label_to_function[quantity.field], self.V_DG1
+                                    label_to_function[quantity.field],
+                                    self.V_DG1,
+                                    form_compiler_parameters=festim.form_compiler_parameters,
                                 )
                         quantity.function = label_to_function[quantity.field]
                     export.compute(self.t)
@@ -105,7 +107,9 @@ class Exports(list):
                         # if not a Function, project it onto V_DG1
                         if not isinstance(label_to_function["retention"], f.Function):
                             label_to_function["retention"] = f.project(
-                                label_to_function["retention"], self.V_DG1
+                                label_to_function["retention"],
+                                self.V_DG1,
+                                form_compiler_parameters=festim.form_compiler_parameters,
                             )
                     export.function = label_to_function[export.field]
                     if isinstance(export, festim.TrapDensityXDMF):
@@ -118,7 +122,9 @@ class Exports(list):
                 # if not a Function, project it onto V_DG1
                 if not isinstance(label_to_function[export.field], f.Function):
                     label_to_function[export.field] = f.project(
-                        label_to_function[export.field], self.V_DG1
+                        label_to_function[export.field],
+                        self.V_DG1,
+                        form_compiler_parameters=festim.form_compiler_parameters,
                     )
                 export.function = label_to_function[export.field]
                 steady = self.final_time == None
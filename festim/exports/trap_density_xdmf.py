@@ -1,4 +1,5 @@
 from festim.exports.xdmf_export import XDMFExport
+import festim
 import fenics as f
 
 
@@ -31,7 +32,9 @@ class TrapDensityXDMF(XDMFExport):
         for mat in self.trap.materials:
             F -= f.inner(self.trap.density[0], v) * dx(mat.id)
 
-        f.solve(F == 0, u, bcs=[])
+        f.solve(
+            F == 0, u, bcs=[], form_compiler_parameters=festim.form_compiler_parameters
+        )
         self.function = u
 
         super().write(t)
@@ -29,6 +29,8 @@ class TXTExport(festim.Export):
         self.filename = filename
         self.header_format = header_format
         self._first_time = True
+        self._header = None
+        self._data = None
 
     @property
     def filename(self):
@@ -60,12 +62,16 @@ class TXTExport(festim.Export):
         return None
 
     def write(self, current_time, steady):
-        # create a DG1 functionspace
-        V_DG1 = f.FunctionSpace(self.function.function_space().mesh(), "DG", 1)
-
-        solution = f.project(self.function, V_DG1)
-        solution_column = np.transpose(solution.vector()[:])
         if self.is_it_time_to_export(current_time):
+            # create a DG1 functionspace
+            V_DG1 = f.FunctionSpace(self.function.function_space().mesh(), "DG", 1)
+
+            solution = f.project(
+                self.function,
+                V_DG1,
+                form_compiler_parameters=festim.form_compiler_parameters,
+            )
+            solution_column = np.transpose(solution.vector()[:])
             # if the directory doesn't exist
             # create it
             dirname = os.path.dirname(self.filename)
@@ -74,7 +80,7 @@ class TXTExport(festim.Export):
 
             # if steady or it is the first time to export
             # write data
-            # else append new column to the existing file
+            # else append new column to the previously exported data
             if steady or self._first_time:
                 if steady:
                     header = "x,t=steady"
@@ -86,14 +92,16 @@ class TXTExport(festim.Export):
                 self._first_time = False
             else:
                 # Update the header
-                old_file = open(self.filename)
-                old_header = old_file.readline().split("\n")[0]
-                old_file.close()
-                header = old_header + f",t={format(current_time, self.header_format)}s"
+                header = (
+                    self._header + f",t={format(current_time, self.header_format)}s"
+                )
                 # Append new column
-                old_columns = np.loadtxt(self.filename, delimiter=",", skiprows=1)
-                data = np.column_stack([old_columns, solution_column])
+                data = np.column_stack([self._data, solution_column])
 
+            # keep the exported data in memory to avoid reading the file back
+            # at the next export
+            self._header = header
+            self._data = data
             np.savetxt(self.filename, data, header=header, delimiter=",", comments="")
 
 
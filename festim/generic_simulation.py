@@ -107,6 +107,7 @@ class Simulation:
         self.h_transport_problem = None
         self.t = 0  # Initialising time to 0s
         self.timer = None
+        self._retention = None
 
     @property
     def traps(self):
@@ -476,15 +477,23 @@ class Simulation:
         """
         self.h_transport_problem.update_post_processing_solutions(self.exports)
 
+        # the retention is only summed again if one of the solutions has
+        # changed so that the exports can reuse the forms built with it
+        solutions = [self.mobile.post_processing_solution] + [
+            trap.post_processing_solution for trap in self.traps
+        ]
+        if self._retention is None or not (
+            len(solutions) == len(self._retention[0])
+            and all(a is b for a, b in zip(solutions, self._retention[0]))
+        ):
+            self._retention = (solutions, sum(solutions))
+
         label_to_function = {
             "solute": self.mobile.post_processing_solution,
             "0": self.mobile.post_processing_solution,
             0: self.mobile.post_processing_solution,
             "T": self.T.T,
-            "retention": sum(
-                [self.mobile.post_processing_solution]
-                + [trap.post_processing_solution for trap in self.traps]
-            ),
+            "retention": self._retention[1],
         }
         for trap in self.traps:
             label_to_function[trap.id] = trap.post_processing_solution
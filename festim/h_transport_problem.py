@@ -38,6 +38,9 @@ class HTransportProblem:
         self.u = None
         self.v = None
         self.u_n = None
+        self._u_restart = None
+        self._problem = None
+        self._u_split = None
         self.newton_solver = None
 
         self.boundary_conditions = []
@@ -183,7 +186,9 @@ class HTransportProblem:
             else:
                 functionspace = self.V.sub(0).collapse()
             initial_guess = project(
-                self.mobile.previous_solution + Constant(DOLFIN_EPS), functionspace
+                self.mobile.previous_solution + Constant(DOLFIN_EPS),
+                functionspace,
+                form_compiler_parameters=festim.form_compiler_parameters,
             )
             self.mobile.solution.assign(initial_guess)
         # this is needed to correctly create the formulation
@@ -279,10 +284,14 @@ class HTransportProblem:
         festim.update_expressions(self.expressions, t)
 
         converged = False
-        u_ = Function(self.u.function_space())
-        u_.assign(self.u)
+        # keep a copy of the solution to restart from if the solver diverges
+        # the function is reused from one time step to the next
+        V = self.u.function_space()
+        if self._u_restart is None or self._u_restart.function_space() != V:
+            self._u_restart = Function(V)
+        self._u_restart.assign(self.u)
         while converged is False:
-            self.u.assign(u_)
+            self.u.assign(self._u_restart)
             nb_it, converged = self.solve_once()
             if dt.adaptive_stepsize is not None or dt.milestones is not None:
                 dt.adapt(t, nb_it, converged)
@@ -303,9 +312,19 @@ class HTransportProblem:
         if self.J is None:  # Define the Jacobian
             du = TrialFunction(self.u.function_space())
             J = derivative(self.F, self.u, du)
+            problem = festim.Problem(J, self.F, self.bcs)
         else:
-            J = self.J
-        problem = festim.Problem(J, self.F, self.bcs)
+            # the Jacobian is fixed, the problem is reused unless the
+            # forms or the boundary conditions have been redefined
+            problem = self._problem
+            if (
+                problem is None
+                or problem.jacobian_form is not self.J
+                or problem.residual_form is not self.F
+                or problem.bcs is not self.bcs
+            ):
+                problem = festim.Problem(self.J, self.F, self.bcs)
+                self._problem = problem
 
         begin("Solving nonlinear variational problem.")  # Add message to fenics logs
         nb_it, converged = self.newton_solver.solve(problem, self.u.vector())
@@ -321,7 +340,11 @@ class HTransportProblem:
         if self.u.function_space().num_sub_spaces() == 0:
             res = [self.u]
         else:
-            res = list(self.u.split())
+            # the sub-functions are views on self.u, they are only created
+            # once so that the exports can reuse the forms built with them
+            if self._u_split is None or self._u_split[0] is not self.u:
+                self._u_split = (self.u, list(self.u.split()))
+            res = self._u_split[1]
 
         for i, trap in enumerate(self.traps, 1):
             trap.post_processing_solution = res[i]
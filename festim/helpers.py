@@ -1,8 +1,13 @@
 import festim
 import xml.etree.ElementTree as ET
-from fenics import Expression, UserExpression, Constant
+from fenics import Expression, UserExpression, Constant, Form
 import sympy as sp
 
+# parameters used to compile every form assembled by FESTIM, they take
+# precedence over the global fenics.parameters["form_compiler"] (in particular
+# cpp_optimize_flags) for FESTIM forms
+form_compiler_parameters = {"cpp_optimize": True, "cpp_optimize_flags": "-O3"}
+
 
 def update_expressions(expressions, t):
     """Update all FEniCS Expression() in expressions.
@@ -44,6 +49,18 @@ def as_constant_or_expression(val):
         return Expression(expr_ccode, degree=2, t=0)
 
 
+def compile_form(form):
+    """Compiles a UFL form with festim.form_compiler_parameters
+
+    Args:
+        form (ufl.Form): the form to compile
+
+    Returns:
+        fenics.Form: the compiled form
+    """
+    return Form(form, form_compiler_parameters=festim.form_compiler_parameters)
+
+
 def kJmol_to_eV(energy):
     """Converts an energy value given in units kJ mol^{-1} to eV
 
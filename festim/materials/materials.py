@@ -323,7 +323,9 @@ class Materials(list):
         for mat in self:
             F += -S * vS * dx(mat.id)
             F += mat.S_0 * f.exp(-mat.E_S / k_B / T) * vS * dx(mat.id)
-        f.solve(F == 0, S, bcs=[])
+        f.solve(
+            F == 0, S, bcs=[], form_compiler_parameters=festim.form_compiler_parameters
+        )
 
         self.S = S
 
@@ -360,8 +362,18 @@ class Materials(list):
                     F_sievert += 1 * test_function_sievert * mesh.dx(mat_id)
 
         # solve the problems
-        f.solve(F_henry == 0, henry, [])
-        f.solve(F_sievert == 0, sievert, [])
+        f.solve(
+            F_henry == 0,
+            henry,
+            [],
+            form_compiler_parameters=festim.form_compiler_parameters,
+        )
+        f.solve(
+            F_sievert == 0,
+            sievert,
+            [],
+            form_compiler_parameters=festim.form_compiler_parameters,
+        )
 
         self.henry_marker = henry
         self.sievert_marker = sievert
@@ -1,4 +1,5 @@
 import fenics as f
+import festim
 
 
 class Problem(f.NonlinearProblem):
@@ -18,7 +19,10 @@ class Problem(f.NonlinearProblem):
         self.residual_form = F
         self.bcs = bcs
         self.assembler = f.SystemAssembler(
-            self.jacobian_form, self.residual_form, self.bcs
+            self.jacobian_form,
+            self.residual_form,
+            self.bcs,
+            form_compiler_parameters=festim.form_compiler_parameters,
         )
         f.NonlinearProblem.__init__(self)
 
@@ -39,7 +39,7 @@ class Temperature:
         self.T = f.Function(V, name="T")
         self.T_n = f.Function(V, name="T_n")
         self.expression = f.Expression(sp.printing.ccode(self.value), t=0, degree=2)
-        self.T.assign(f.interpolate(self.expression, V))
+        self.T.interpolate(self.expression)
         self.T_n.assign(self.T)
 
     def update(self, t):
@@ -50,7 +50,7 @@ class Temperature:
         """
         self.T_n.assign(self.T)
         self.expression.t = t
-        self.T.assign(f.interpolate(self.expression, self.T.function_space()))
+        self.T.interpolate(self.expression)
 
     def is_steady_state(self):
         return "t" not in sp.printing.ccode(self.value)
@@ -29,6 +29,8 @@ class HeatTransferProblem(festim.Temperature):
     Attributes:
         F (fenics.Form): the variational form of the heat transfer problem
         v_T (fenics.TestFunction): the test function
+        problem (festim.Problem): the nonlinear problem solved at each
+            time step
         newton_solver (fenics.NewtonSolver): Newton solver for solving the nonlinear problem
         initial_condition (festim.InitialCondition): the initial condition
         sub_expressions (list): contains time dependent fenics.Expression to
@@ -59,6 +61,7 @@ class HeatTransferProblem(festim.Temperature):
 
         self.F = 0
         self.v_T = None
+        self.problem = None
         self.sources = []
         self.boundary_conditions = []
         self.sub_expressions = []
@@ -128,19 +131,20 @@ class HeatTransferProblem(festim.Temperature):
         self.define_variational_problem(materials, mesh, dt)
         self.create_dirichlet_bcs(mesh.surface_markers)
 
+        # the Jacobian and the assembler don't change between time steps
+        dT = f.TrialFunction(self.T.function_space())
+        JT = f.derivative(self.F, self.T, dT)  # Define the Jacobian
+        self.problem = festim.Problem(JT, self.F, self.dirichlet_bcs)
+
         if not self.newton_solver:
             self.define_newton_solver()
 
         if not self.transient:
             print("Solving stationary heat equation")
-            dT = f.TrialFunction(self.T.function_space())
-            JT = f.derivative(self.F, self.T, dT)
-            problem = festim.Problem(JT, self.F, self.dirichlet_bcs)
-
             f.begin(
                 "Solving nonlinear variational problem."
             )  # Add message to fenics logs
-            self.newton_solver.solve(problem, self.T.vector())
+            self.newton_solver.solve(self.problem, self.T.vector())
             f.end()
 
             self.T_n.assign(self.T)
@@ -260,14 +264,10 @@ class HeatTransferProblem(festim.Temperature):
         if self.transient:
             festim.update_expressions(self.sub_expressions, t)
             # Solve heat transfers
-            dT = f.TrialFunction(self.T.function_space())
-            JT = f.derivative(self.F, self.T, dT)  # Define the Jacobian
-            problem = festim.Problem(JT, self.F, self.dirichlet_bcs)
-
             f.begin(
                 "Solving nonlinear variational problem."
             )  # Add message to fenics logs
-            self.newton_solver.solve(problem, self.T.vector())
+            self.newton_solver.solve(self.problem, self.T.vector())
             f.end()
 
             self.T_n.assign(self.T)
@@ -70,6 +70,56 @@ def test_solve_once_jacobian_is_none():
     assert converged
 
 
+def test_solve_once_reuses_problem_with_fixed_jacobian():
+    """Checks that solve_once() reuses the same festim.Problem when the
+    jacobian is fixed (update_jacobian=False) and creates a new one when the
+    boundary conditions or the jacobian are redefined"""
+    # build
+    mesh = f.UnitIntervalMesh(8)
+    V = f.FunctionSpace(mesh, "CG", 1)
+
+    my_settings = festim.Settings(
+        absolute_tolerance=1e-10,
+        relative_tolerance=1e-10,
+        maximum_iterations=50,
+        update_jacobian=False,
+    )
+    my_problem = festim.HTransportProblem(
+        festim.Mobile(), festim.Traps([]), festim.Temperature(200), my_settings, []
+    )
+    my_problem.define_newton_solver()
+    my_problem.u = f.Function(V)
+    my_problem.u_n = f.Function(V)
+    my_problem.v = f.TestFunction(V)
+    my_problem.F = (
+        (my_problem.u - my_problem.u_n) * my_problem.v * f.dx
+        + 1 * my_problem.v * f.dx
+        + f.dot(f.grad(my_problem.u), f.grad(my_problem.v)) * f.dx
+    )
+    my_problem.create_dirichlet_bcs(materials=None, mesh=None)
+    my_problem.compute_jacobian()
+
+    # run
+    my_problem.solve_once()
+    problem = my_problem._problem
+    my_problem.solve_once()
+
+    # test
+    assert problem is not None
+    assert my_problem._problem is problem
+
+    # new boundary conditions
+    my_problem.create_dirichlet_bcs(materials=None, mesh=None)
+    my_problem.solve_once()
+    assert my_problem._problem is not problem
+
+    # new jacobian
+    problem = my_problem._problem
+    my_problem.compute_jacobian()
+    my_problem.solve_once()
+    assert my_problem._problem is not problem
+
+
 def test_solve_once_returns_false():
     """Checks that solve_once() returns False when didn't converge"""
     # build
@@ -85,3 +85,28 @@ class Test_solve_once_with_custom_solver:
         problem_2.create_functions(materials=materials, mesh=mesh)
 
         assert (problem_1.T.vector() == problem_2.T.vector()).all()
+
+
+def test_update_reuses_problem():
+    """Checks that the problem created by create_functions() is reused by
+    update() at each time step"""
+    mesh = festim.MeshFromRefinements(10, size=0.1)
+    materials = festim.Materials(
+        [festim.Material(id=1, D_0=1, E_D=0, thermal_cond=1, heat_capacity=1, rho=1)]
+    )
+    mesh.define_measures(materials)
+
+    my_problem = festim.HeatTransferProblem(transient=True, initial_condition=300)
+    my_problem.boundary_conditions = [
+        festim.DirichletBC(surfaces=[1, 2], value=300 + festim.t, field="T"),
+    ]
+    my_problem.create_functions(
+        materials=materials, mesh=mesh, dt=festim.Stepsize(initial_value=1)
+    )
+    problem = my_problem.problem
+
+    my_problem.update(t=1)
+    my_problem.update(t=2)
+
+    assert problem is not None
+    assert my_problem.problem is problem
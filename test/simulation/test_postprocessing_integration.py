@@ -71,6 +71,36 @@ class TestPostProcessing:
         assert len(my_sim.exports[0].data) == i + 1
         assert my_sim.exports[0].data[i][0] == t
 
+    def test_forms_reused_between_post_processing_calls(self, my_sim):
+        """
+        Checks that the forms of the derived quantities are compiled only once
+        when run_post_processing() is called several times with traps
+
+        Args:
+            my_sim (festim.Simulation): the simulation object
+        """
+        trap_quantity = festim.TotalVolume("1", 1)
+        retention_quantity = festim.TotalVolume("retention", 1)
+        derived_quantities = festim.DerivedQuantities(
+            [trap_quantity, retention_quantity]
+        )
+        derived_quantities.assign_measures_to_quantities(my_sim.mesh.dx, my_sim.mesh.ds)
+        derived_quantities.assign_properties_to_quantities(my_sim.materials)
+
+        my_sim.exports = [derived_quantities]
+
+        my_sim.t = 1
+        my_sim.run_post_processing()
+        trap_form = trap_quantity._form
+        retention_form = retention_quantity._form
+
+        my_sim.t = 2
+        my_sim.run_post_processing()
+
+        assert trap_form is not None
+        assert trap_quantity._form is trap_form
+        assert retention_quantity._form is retention_form
+
     def test_pure_diffusion(self, my_sim):
         """
         Checks that run_post_processing() assigns data correctly
@@ -43,3 +43,29 @@ class TestCompute:
         )
         computed = self.my_average.compute()
         assert computed == expected
+
+
+def test_compute_with_new_measure():
+    """Checks that AverageSurface.compute() gives the correct value when a
+    new measure is assigned
+    """
+    mesh = f.UnitSquareMesh(10, 10)
+    V = f.FunctionSpace(mesh, "P", 1)
+    c = f.interpolate(f.Expression("x[0]", degree=1), V)
+
+    surface_markers = f.MeshFunction("size_t", mesh, 1, 0)
+    f.CompiledSubDomain("near(x[0], 1)").mark(surface_markers, 1)
+    ds = f.Measure("ds", domain=mesh, subdomain_data=surface_markers)
+
+    my_average = AverageSurface("solute", 1)
+    my_average.function = c
+    my_average.ds = ds
+    assert my_average.compute() == pytest.approx(1)
+
+    # assign a measure on another surface
+    new_markers = f.MeshFunction("size_t", mesh, 1, 0)
+    f.CompiledSubDomain("near(x[1], 0)").mark(new_markers, 1)
+    new_ds = f.Measure("ds", domain=mesh, subdomain_data=new_markers)
+    my_average.ds = new_ds
+    expected = f.assemble(c * new_ds(1)) / f.assemble(1 * new_ds(1))
+    assert my_average.compute() == pytest.approx(expected)
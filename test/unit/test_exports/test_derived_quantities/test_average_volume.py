@@ -43,3 +43,32 @@ class TestCompute:
         )
         computed = self.my_average.compute()
         assert computed == expected
+
+
+def test_compute_with_new_measure():
+    """Checks that AverageVolume.compute() gives the correct value when the
+    function is updated and when a new measure is assigned
+    """
+    mesh = f.UnitIntervalMesh(10)
+    V = f.FunctionSpace(mesh, "P", 1)
+    c = f.interpolate(f.Expression("x[0]", degree=1), V)
+
+    volume_markers = f.MeshFunction("size_t", mesh, 1, 1)
+    dx = f.Measure("dx", domain=mesh, subdomain_data=volume_markers)
+
+    my_average = AverageVolume("solute", 1)
+    my_average.function = c
+    my_average.dx = dx
+    my_average.compute()
+
+    # update the function in place
+    c.assign(f.interpolate(f.Expression("2*x[0]", degree=1), V))
+    assert my_average.compute() == pytest.approx(1)
+
+    # assign a measure on a smaller volume
+    new_markers = f.MeshFunction("size_t", mesh, 1, 0)
+    f.CompiledSubDomain("x[0] < 0.5").mark(new_markers, 1)
+    new_dx = f.Measure("dx", domain=mesh, subdomain_data=new_markers)
+    my_average.dx = new_dx
+    expected = f.assemble(c * new_dx(1)) / f.assemble(1 * new_dx(1))
+    assert my_average.compute() == pytest.approx(expected)
@@ -342,6 +342,93 @@ class TestCompute:
 
         assert my_derv_quant.data[1] == expected_data
 
+    def test_totals_same_function(self):
+        """Check for the case of several festim.TotalVolume and
+        festim.TotalSurface objects sharing the same function"""
+        my_derv_quant = DerivedQuantities(
+            [
+                TotalVolume("T", 1),
+                TotalVolume("T", 2),
+                TotalSurface("T", 1),
+                TotalSurface("T", 2),
+            ]
+        )
+        for quantity in my_derv_quant:
+            quantity.function = self.T
+        my_derv_quant.assign_measures_to_quantities(self.dx, self.ds)
+        t = 2
+
+        expected_data = [t] + [quantity.compute() for quantity in my_derv_quant]
+
+        my_derv_quant.data = []
+        my_derv_quant.compute(t)
+
+        assert my_derv_quant.data[1] == pytest.approx(expected_data)
+
+    def test_totals_form_reused_until_measure_changes(self):
+        """Checks that the form of grouped totals is compiled once and
+        compiled again when a new measure is assigned"""
+        my_derv_quant = DerivedQuantities([TotalVolume("T", 1), TotalVolume("T", 2)])
+        u = f.interpolate(f.Expression("x[0]", degree=1), self.V)
+        for quantity in my_derv_quant:
+            quantity.function = u
+        my_derv_quant.assign_measures_to_quantities(self.dx, self.ds)
+
+        my_derv_quant.compute(1)
+        _, form, _ = list(my_derv_quant._totals_forms.values())[0]
+        my_derv_quant.compute(2)
+        assert list(my_derv_quant._totals_forms.values())[0][1] is form
+
+        new_markers = f.MeshFunction("size_t", self.mesh, 1, 2)
+        new_dx = f.dx(domain=self.mesh, subdomain_data=new_markers)
+        my_derv_quant.assign_measures_to_quantities(new_dx, self.ds)
+        my_derv_quant.compute(3)
+
+        expected = [3, 0, f.assemble(u * new_dx(2))]
+        assert my_derv_quant.data[-1] == pytest.approx(expected)
+
+    def test_totals_different_subdomain_data(self):
+        """Checks that festim.TotalVolume objects sharing the same function
+        but with measures on different markers are computed correctly"""
+        u = f.interpolate(f.Expression("x[0]", degree=1), self.V)
+        other_markers = f.MeshFunction("size_t", self.mesh, 1, 0)
+        f.CompiledSubDomain("x[0] < 0.5").mark(other_markers, 1)
+        other_dx = f.Measure("dx", domain=self.mesh, subdomain_data=other_markers)
+
+        total_1 = TotalVolume("T", 1)
+        total_2 = TotalVolume("T", 1)
+        my_derv_quant = DerivedQuantities([total_1, total_2])
+        for quantity in my_derv_quant:
+            quantity.function = u
+        total_1.dx = self.dx
+        total_2.dx = other_dx
+
+        my_derv_quant.compute(1)
+
+        expected = [1, f.assemble(u * self.dx(1)), f.assemble(u * other_dx(1))]
+        assert my_derv_quant.data[1] == pytest.approx(expected)
+
+    def test_totals_subclass_not_grouped(self):
+        """Checks that a subclass of festim.TotalVolume overriding compute()
+        is not assembled with the other totals"""
+
+        class DoubleTotalVolume(TotalVolume):
+            def compute(self):
+                return 2 * super().compute()
+
+        u = f.interpolate(f.Expression("x[0]", degree=1), self.V)
+        my_derv_quant = DerivedQuantities(
+            [TotalVolume("T", 1), DoubleTotalVolume("T", 1)]
+        )
+        for quantity in my_derv_quant:
+            quantity.function = u
+        my_derv_quant.assign_measures_to_quantities(self.dx, self.ds)
+
+        my_derv_quant.compute(1)
+
+        total = f.assemble(u * self.dx(1))
+        assert my_derv_quant.data[1] == pytest.approx([1, total, 2 * total])
+
 
 class TestWrite:
     @pytest.fixture
@@ -377,6 +464,49 @@ class TestWrite:
 
         assert os.path.exists(filename)
 
+    def test_write_twice(self, folder, my_derived_quantities):
+        """Checks that rows added between two write() calls are appended to
+        the file and that previous rows aren't duplicated
+        """
+        filename = "{}/my_file.csv".format(folder)
+        my_derived_quantities.filename = filename
+        my_derived_quantities.write()
+        my_derived_quantities.data.append([4, 5, 6])
+        my_derived_quantities.write()
+
+        with open(filename) as file:
+            lines = file.read().splitlines()
+        assert lines == ["a,b,c", "1,2,3", "1,2,3", "4,5,6"]
+
+    def test_write_new_filename(self, folder, my_derived_quantities):
+        """Checks that all the data is written to a new file when filename is
+        changed after a first write()
+        """
+        my_derived_quantities.filename = "{}/my_file.csv".format(folder)
+        my_derived_quantities.write()
+        my_derived_quantities.data.append([4, 5, 6])
+        filename = "{}/my_other_file.csv".format(folder)
+        my_derived_quantities.filename = filename
+        my_derived_quantities.write()
+
+        with open(filename) as file:
+            lines = file.read().splitlines()
+        assert lines == ["a,b,c", "1,2,3", "1,2,3", "4,5,6"]
+
+    def test_write_after_removing_rows(self, folder, my_derived_quantities):
+        """Checks that the file is rewritten when rows are removed from data
+        after a first write()
+        """
+        filename = "{}/my_file.csv".format(folder)
+        my_derived_quantities.filename = filename
+        my_derived_quantities.write()
+        del my_derived_quantities.data[1:]
+        my_derived_quantities.write()
+
+        with open(filename) as file:
+            lines = file.read().splitlines()
+        assert lines == ["a,b,c"]
+
 
 class TestFilter:
     """Tests the filter method of DerivedQUantities"""
@@ -90,6 +90,37 @@ class TestCompute:
         assert flux == expected_flux
 
 
+def test_compute_after_new_properties():
+    """Checks that SurfaceFlux.compute() uses the new properties when they
+    are reassigned after a first computation
+    """
+    mesh = f.UnitIntervalMesh(10)
+    V = f.FunctionSpace(mesh, "P", 1)
+    c = f.interpolate(f.Expression("x[0]", degree=1), V)
+    T = f.interpolate(f.Expression("1 + x[0]", degree=1), V)
+    surface_markers = f.MeshFunction("size_t", mesh, 0)
+    f.CompiledSubDomain("near(x[0], 1) && on_boundary").mark(surface_markers, 1)
+    ds = f.Measure("ds", domain=mesh, subdomain_data=surface_markers)
+    n = f.FacetNormal(mesh)
+
+    my_flux = SurfaceFlux("solute", 1)
+    my_flux.function = c
+    my_flux.n = n
+    my_flux.ds = ds
+    my_flux.T = T
+    my_flux.D = f.Constant(2)
+    my_flux.Q = f.Constant(4)
+    my_flux.compute(soret=True)
+
+    D = f.Constant(3)
+    Q = f.Constant(5)
+    my_flux.D = D
+    my_flux.Q = Q
+    expected_flux = f.assemble(D * f.dot(f.grad(c), n) * ds(1))
+    expected_flux += f.assemble(D * c * Q / (k_B * T**2) * f.dot(f.grad(T), n) * ds(1))
+    assert my_flux.compute(soret=True) == pytest.approx(expected_flux)
+
+
 @pytest.mark.parametrize("radius", [2, 3])
 @pytest.mark.parametrize("r0", [0, 2])
 @pytest.mark.parametrize("height", [2, 3])
@@ -46,6 +46,31 @@ class TestCompute:
         assert produced == expected
 
 
+def test_compute_after_function_update():
+    """Checks that TotalVolume.compute() follows the values of the function
+    when it is updated in place and when it is replaced by a new function
+    """
+    mesh = f.UnitIntervalMesh(10)
+    V = f.FunctionSpace(mesh, "P", 1)
+    volume_markers = f.MeshFunction("size_t", mesh, 1, 1)
+    dx = f.Measure("dx", domain=mesh, subdomain_data=volume_markers)
+
+    c = f.interpolate(f.Expression("x[0]", degree=1), V)
+    my_total = TotalVolume("solute", 1)
+    my_total.function = c
+    my_total.dx = dx
+    my_total.compute()
+
+    # update the values in place
+    c.assign(f.interpolate(f.Expression("2*x[0]", degree=1), V))
+    assert my_total.compute() == pytest.approx(f.assemble(c * dx(1)))
+
+    # rebind the function
+    new_c = f.interpolate(f.Expression("3*x[0]", degree=1), V)
+    my_total.function = new_c
+    assert my_total.compute() == pytest.approx(f.assemble(new_c * dx(1)))
+
+
 @pytest.mark.parametrize(
     "function, field, expected_title",
     [
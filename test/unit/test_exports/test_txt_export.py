@@ -1,5 +1,6 @@
 from festim import TXTExport, Stepsize
 import fenics as f
+import numpy as np
 import os
 import pytest
 from pathlib import Path
@@ -68,6 +69,19 @@ class TestWrite:
 
         assert os.path.exists(my_export.filename)
 
+    def test_several_times(self, my_export, function):
+        """Checks that a column is added to the file at each export time"""
+        my_export.function = function
+        for current_time in [1, 1.5, 2, 3]:
+            my_export.write(current_time=current_time, steady=False)
+
+        with open(my_export.filename) as file:
+            header = file.readline().split("\n")[0]
+        data = np.loadtxt(my_export.filename, delimiter=",", skiprows=1)
+
+        assert header == "x,t=1.00e+00s,t=2.00e+00s,t=3.00e+00s"
+        assert data.shape[1] == 4
+
     def test_error_filename_endswith_txt(self, my_export):
         with pytest.raises(ValueError, match="filename must end with .txt"):
             my_export.filename = "coucou"
@@ -5,9 +5,11 @@ from festim import (
     as_constant,
     as_expression,
     as_constant_or_expression,
+    compile_form,
     t,
 )
 from fenics import Constant, Expression, UserExpression
+import fenics as f
 import pytest
 
 
@@ -61,3 +63,15 @@ def test_as_expression(expression, type):
 )
 def test_as_constant_or_expression(expression, type):
     assert isinstance(as_constant_or_expression(expression), type)
+
+
+def test_compile_form():
+    """Checks that compile_form returns a fenics.Form that can be assembled"""
+    mesh = f.UnitIntervalMesh(10)
+    V = f.FunctionSpace(mesh, "P", 1)
+    u = f.interpolate(f.Constant(2), V)
+
+    form = compile_form(u * f.dx)
+
+    assert isinstance(form, f.Form)
+    assert f.assemble(form) == pytest.approx(2)
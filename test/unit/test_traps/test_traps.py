@@ -259,3 +259,44 @@ def test_instanciate_with_no_elements():
     """
     # define exports
     festim.Traps()
+
+
+def test_solve_extrinsic_traps_reuses_problem():
+    """Checks that solve_extrinsic_traps() creates the problem of an extrinsic
+    trap once and creates a new one when the form is redefined"""
+    my_trap = festim.ExtrinsicTrap(
+        1,
+        1,
+        1,
+        1,
+        "mat_name",
+        phi_0=1,
+        n_amax=2,
+        n_bmax=2,
+        eta_a=3,
+        eta_b=4,
+        f_a=5,
+        f_b=6,
+    )
+    my_traps = festim.Traps([my_trap])
+    mesh = f.UnitIntervalMesh(10)
+    V = f.FunctionSpace(mesh, "P", 1)
+    my_trap.density = [f.Function(V)]
+    my_trap.density_previous_solution = f.Function(V)
+    my_trap.density_test_function = f.TestFunction(V)
+    my_temp = festim.Temperature(value=100)
+    my_temp.T = f.Function(V)
+    dt = festim.Stepsize(initial_value=1)
+    my_trap.create_form_density(f.dx(), dt, my_temp)
+    my_trap.define_newton_solver()
+
+    my_traps.solve_extrinsic_traps()
+    problem = my_trap.density_problem
+    my_traps.solve_extrinsic_traps()
+
+    assert problem is not None
+    assert my_trap.density_problem is problem
+
+    my_trap.create_form_density(f.dx(), dt, my_temp)
+    my_traps.solve_extrinsic_traps()
+    assert my_trap.density_problem is not problem